@@ -1,3 +1,19 @@
 """aiomailru."""
-from .api import API  # noqa: F401
-from .auth import CodeGrant, PasswordGrant, RefreshGrant, full_scope  # noqa: F401
+from typing import Any
+
+__all__ = ['API', 'CodeGrant', 'PasswordGrant', 'RefreshGrant', 'full_scope']
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the public API lazily (PEP 562).
+
+    Importing the package stays cheap; httpx and the session machinery
+    load on first attribute access.
+    """
+    if name == 'API':
+        from .api import API
+        return API
+    if name in ('CodeGrant', 'PasswordGrant', 'RefreshGrant', 'full_scope'):
+        from . import auth
+        return getattr(auth, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,11 +1,40 @@
 """Authurization."""
+import asyncio
 import logging
-from typing import Any, Dict, Tuple
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
 
 from httpx import AsyncClient
 
 log = logging.getLogger(__name__)
 
+_auth_client: Optional[AsyncClient] = None
+
+
+def auth_client() -> AsyncClient:
+    """Return the shared client for OAuth token requests.
+
+    Reusing one client keeps the connection pool and TLS session warm
+    across token exchanges instead of paying a full handshake per grant.
+
+    Returns:
+        AsyncClient
+
+    """
+    global _auth_client
+    if _auth_client is None or _auth_client.is_closed:
+        _auth_client = AsyncClient(
+            default_encoding='application/x-www-formurlencoded',
+            follow_redirects=True,
+        )
+    return _auth_client
+
+
+async def close_auth_client() -> None:
+    """Close the shared client for OAuth token requests."""
+    if _auth_client is not None and not _auth_client.is_closed:
+        await _auth_client.aclose()
+
 
 def full_scope() -> str:
     """Full scope."""
@@ -15,27 +44,29 @@ def full_scope() -> str:
 class Grant:
     """Authorization Grant."""
 
-    __slots__ = ('_app_id', '_auth_client')
+    __slots__ = ('_app_id',)
 
     def __init__(self, app_id: str) -> None:
         """Set app info."""
         self._app_id = app_id
-        self._auth_client = AsyncClient(
-            default_encoding='application/x-www-formurlencoded',
-            follow_redirects=True,
-        )
+
+    @property
+    def _auth_client(self) -> AsyncClient:
+        """Shared OAuth client, resolved per call.
+
+        Resolving lazily instead of pinning the client at construction
+        lets auth_client() rebuild it after close_auth_client(), so
+        long-lived grants keep working.
+        """
+        return auth_client()
 
     async def __aenter__(self) -> 'Grant':
         """Enter."""
         await self.authorize()
-        if not self._auth_client.is_closed:
-            await self._auth_client.aclose()
         return self
 
     async def __aexit__(self, *args: Tuple[Any, Any, Any]) -> None:
         """Exit."""
-        if not self._auth_client.is_closed:
-            await self._auth_client.aclose()
 
     async def authorize(self) -> 'Grant':
         """Authorizate."""
@@ -60,9 +91,7 @@ class CodeGrant(Grant):
     """
 
     __slots__ = (
-        '_code',
-        '_secret_key',
-        '_redirect_uri',
+        '_params',
         'refresh_token',
         'session_key',
         'expires_in',
@@ -78,9 +107,13 @@ class CodeGrant(Grant):
     ) -> None:
         """Set attributes."""
         super().__init__(app_id)
-        self._redirect_uri = redirect_uri
-        self._secret_key = secret_key
-        self._code = code
+        self._params = {
+            'client_id': app_id,
+            'client_secret': secret_key,
+            'grant_type': 'authorization_code',
+            'redirect_uri': redirect_uri,
+            'code': code,
+        }
 
     async def authorize(self) -> 'CodeGrant':
         """Authorize with OAuth 2.0 (Authorization Code).
@@ -91,21 +124,16 @@ class CodeGrant(Grant):
         """
         resp = await self._auth_client.post(
             'https://connect.mail.ru/oauth/token',
-            data={
-                'client_id': self._app_id,
-                'client_secret': self._secret_key,
-                'grant_type': 'authorization_code',
-                'redirect_uri': self._redirect_uri,
-                'code': self._code,
-            },
+            data=self._params,
         )
         resp.raise_for_status()
 
         try:
             respjson: Dict[str, Any] = resp.json()
         except Exception:
-            content = resp.read().decode()
-            log.error(f'GET {resp.url} {resp.status_code}: {content}')
+            if log.isEnabledFor(logging.ERROR):
+                content = resp.content.decode(errors='replace')
+                log.error('GET %s %s: %s', resp.url, resp.status_code, content)
             raise
 
         try:
@@ -134,10 +162,7 @@ class PasswordGrant(Grant):
     """
 
     __slots__ = (
-        '_email',
-        '_password',
-        '_secret_key',
-        '_scope',
+        '_params',
         'session_key',
         'refresh_token',
         'expires_in',
@@ -154,10 +179,14 @@ class PasswordGrant(Grant):
     ) -> None:
         """Set attributes."""
         super().__init__(app_id)
-        self._secret_key = secret_key
-        self._username = username
-        self._password = password
-        self._scope = scope
+        self._params = {
+            'grant_type': 'password',
+            'client_id': app_id,
+            'client_secret': secret_key,
+            'username': username,
+            'password': password,
+            'scope': scope,
+        }
 
     async def authorize(self) -> 'PasswordGrant':
         """Authorize with OAuth 2.0 (Password Grant).
@@ -168,14 +197,7 @@ class PasswordGrant(Grant):
         """
         resp = await self._auth_client.post(
             'https://appsmail.ru/oauth/token',
-            data={
-                'grant_type': 'password',
-                'client_id': self._app_id,
-                'client_secret': self._secret_key,
-                'username': self._username,
-                'password': self._password,
-                'scope': self._scope,
-            },
+            data=self._params,
         )
 
         resp.raise_for_status()
@@ -183,7 +205,9 @@ class PasswordGrant(Grant):
         try:
             respjson: Dict[str, Any] = resp.json()
         except Exception:
-            log.error(f'GET {resp.url} {resp.read().decode()}')
+            if log.isEnabledFor(logging.ERROR):
+                content = resp.content.decode(errors='replace')
+                log.error('GET %s %s', resp.url, content)
             raise
 
         try:
@@ -211,9 +235,12 @@ class RefreshGrant(Grant):
 
     """
 
+    REUSE_WINDOW = 5.0
+
     __slots__ = (
-        '_secret_key',
-        '_refresh_token',
+        '_params',
+        '_refresh_lock',
+        '_refreshed_at',
         'refresh_token',
         'session_key',
         'expires_in',
@@ -228,24 +255,47 @@ class RefreshGrant(Grant):
     ) -> None:
         """Set attributes."""
         super().__init__(app_id)
-        self._refresh_token = refresh_token
-        self._secret_key = secret_key
+        self._params = {
+            'client_id': app_id,
+            'grant_type': 'refresh_token',
+            'refresh_token': refresh_token,
+            'client_secret': secret_key,
+        }
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._refreshed_at = 0.0
 
     async def authorize(self) -> 'RefreshGrant':
         """Authorize with OAuth 2.0 (Refresh Token).
 
+        Concurrent callers are serialized: whoever wins the lock
+        refreshes, the rest reuse the fresh token instead of burning
+        the rotating refresh token twice. This also skips the exchange
+        for any call made within ``REUSE_WINDOW`` seconds of the last
+        refresh; set ``REUSE_WINDOW = 0`` on the instance or subclass
+        to refresh on every call.
+
+        Returns:
+            RefreshGrant
+
+        """
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+
+        async with self._refresh_lock:
+            if monotonic() - self._refreshed_at < self.REUSE_WINDOW:
+                return self
+            return await self._refresh()
+
+    async def _refresh(self) -> 'RefreshGrant':
+        """Exchange the refresh token for an access token.
+
         Returns:
             RefreshGrant
 
         """
         resp = await self._auth_client.post(
             'https://appsmail.ru/oauth/token',
-            data={
-                'client_id': self._app_id,
-                'grant_type': 'refresh_token',
-                'refresh_token': self._refresh_token,
-                'client_secret': self._secret_key,
-            },
+            data=self._params,
         )
 
         resp.raise_for_status()
@@ -253,7 +303,9 @@ class RefreshGrant(Grant):
         try:
             respjson: Dict[str, Any] = resp.json()
         except Exception:
-            log.error(f'GET {resp.url} {resp.read().decode()}')
+            if log.isEnabledFor(logging.ERROR):
+                content = resp.content.decode(errors='replace')
+                log.error('GET %s %s', resp.url, content)
             raise
 
         try:
@@ -264,4 +316,26 @@ class RefreshGrant(Grant):
         except KeyError as e:
             raise KeyError(*e.args, respjson) from e
 
+        # the token rotates: the next exchange must POST the new one
+        self._params['refresh_token'] = self.refresh_token
+        self._refreshed_at = monotonic()
         return self
+
+
+async def refresh_many(grants: List[RefreshGrant]) -> List[Any]:
+    """Authorize several refresh grants concurrently.
+
+    All grants share one client, so the POSTs are pipelined over the
+    same connection pool and complete in about one round trip.
+
+    Args:
+        grants (List[RefreshGrant]): refresh grants
+
+    Returns:
+        List[Any]: authorized grants, exceptions in place of failures
+
+    """
+    return await asyncio.gather(
+        *(grant.authorize() for grant in grants),
+        return_exceptions=True,
+    )
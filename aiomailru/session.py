@@ -1,12 +1,26 @@
 """Sessions."""
-import hashlib
+import asyncio
 import logging
-from typing import Any, Dict
+from collections import OrderedDict
+from hashlib import md5
+from importlib.util import find_spec
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import quote
 
-from httpx import AsyncClient
+from httpx import AsyncClient, Limits
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
 log = logging.getLogger(__name__)
 
+_SIG_CACHE_SIZE = 128
+_HTTP2 = find_spec('h2') is not None
+
+API_PATH = 'platform/api'
+
 
 class Session:
     """A wrapper for httpx.AsyncClient.
@@ -24,18 +38,48 @@ class Session:
             default_encoding='text/javascript; charset=utf-8',
             base_url='http://appsmail.ru',
             follow_redirects=True,
+            http2=_HTTP2,
+            limits=Limits(
+                max_keepalive_connections=64,
+                max_connections=256,
+                keepalive_expiry=60.0,
+            ),
         )
 
 
 class PublicSession(Session):
     """Session for public API methods of Platform@Mail.Ru."""
 
-    async def request(self, params: Dict[str, Any],
+    LOADS = staticmethod(loads)
+
+    __slots__ = ()
+
+    async def request(self, params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Request public data.
 
         Args:
-            params (Dict[str, Any]): query parameters
+            params (Optional[Dict[str, Any]]): query parameters
+
+        Returns:
+            Dict[str, Any]
+
+        Raises:
+            HTTPStatusError: if one occurred
+
+        """
+        return await self._fetch(API_PATH, params)
+
+    async def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Fetch and parse a response.
+
+        Args:
+            url (str): url, may already contain a query string
+            params (Optional[Dict[str, Any]]): query parameters
 
         Returns:
             Dict[str, Any]
@@ -45,20 +89,21 @@ class PublicSession(Session):
 
         """
         try:
-            resp = await self.client.get('platform/api', params=params)
+            resp = await self.client.get(url, params=params)
         except Exception:
-            log.error(f'GET {params["method"]} request failed')
+            log.error('GET %s request failed', url)
             raise
         else:
-            log.info(f'GET {resp.url} {resp.status_code}')
+            log.info('GET %s %s', resp.url, resp.status_code)
 
         resp.raise_for_status()
 
         try:
-            return resp.json()
+            return self.LOADS(resp.content)
         except Exception:
-            content = resp.read().decode()
-            log.error(f'GET {resp.url} {resp.status_code} {content}')
+            if log.isEnabledFor(logging.ERROR):
+                content = resp.content.decode(errors='replace')
+                log.error('GET %s %s %s', resp.url, resp.status_code, content)
             raise
 
 
@@ -74,7 +119,22 @@ class TokenSession(PublicSession):
 
     """
 
-    __slots__ = ('app_id', 'session_key', 'secret', 'secure', 'uid')
+    HASH_CTOR = md5
+
+    __slots__ = (
+        '_app_id',
+        '_session_key',
+        '_secret',
+        '_secure',
+        '_uid',
+        '_md5_prefix',
+        '_required_params',
+        '_secret_b',
+        '_sig_buf',
+        '_sig_cache',
+        '_sig_keys',
+        '_sig_keyset',
+    )
 
     def __init__(
             self,
@@ -86,11 +146,82 @@ class TokenSession(PublicSession):
         ) -> None:
         """Set credentials."""
         super().__init__()
-        self.app_id = app_id
-        self.session_key = session_key
-        self.secret = secret
-        self.secure = secure
-        self.uid = uid
+        self._app_id = app_id
+        self._session_key = session_key
+        self._secret = secret
+        self._secure = secure
+        self._uid = uid
+        self._required_params = {
+            'session_key': session_key,
+            'app_id': app_id,
+            'secure': secure,
+        }
+        self._md5_prefix = self.HASH_CTOR(uid.encode())
+        self._secret_b = secret.encode()
+        self._sig_buf = bytearray()
+        self._sig_cache: 'OrderedDict[Tuple, str]' = OrderedDict()
+        self._sig_keys: Tuple[str, ...] = ()
+        self._sig_keyset: FrozenSet[str] = frozenset()
+
+    @property
+    def app_id(self) -> str:
+        """Client id."""
+        return self._app_id
+
+    @app_id.setter
+    def app_id(self, app_id: str) -> None:
+        """Set client id and refresh dependent caches."""
+        self._app_id = app_id
+        self._required_params['app_id'] = app_id
+        self._sig_cache.clear()
+
+    @property
+    def secure(self) -> str:
+        """Secure mode flag."""
+        return self._secure
+
+    @secure.setter
+    def secure(self, secure: str) -> None:
+        """Set secure mode flag and refresh dependent caches."""
+        self._secure = secure
+        self._required_params['secure'] = secure
+        self._sig_cache.clear()
+
+    @property
+    def secret(self) -> str:
+        """Private or secret key."""
+        return self._secret
+
+    @secret.setter
+    def secret(self, secret: str) -> None:
+        """Set the signing key and refresh dependent caches."""
+        self._secret = secret
+        self._secret_b = secret.encode()
+        self._sig_cache.clear()
+
+    @property
+    def uid(self) -> str:
+        """User id."""
+        return self._uid
+
+    @uid.setter
+    def uid(self, uid: str) -> None:
+        """Set user id and refresh dependent caches."""
+        self._uid = uid
+        self._md5_prefix = self.HASH_CTOR(uid.encode())
+        self._sig_cache.clear()
+
+    @property
+    def session_key(self) -> str:
+        """Access token."""
+        return self._session_key
+
+    @session_key.setter
+    def session_key(self, session_key: str) -> None:
+        """Set access token and refresh dependent caches."""
+        self._session_key = session_key
+        self._required_params['session_key'] = session_key
+        self._sig_cache.clear()
 
     def sign_params(self, params: Dict[str, Any]) -> str:
         """Sign query string according to signature circuit.
@@ -104,24 +235,73 @@ class TokenSession(PublicSession):
             str
 
         """
-        query = ''.join(k + '=' + str(params[k]) for k in sorted(params))
-        query = self.uid + query + self.secret
-        sig = hashlib.md5(query.encode('UTF-8')).hexdigest()
+        if frozenset(params) != self._sig_keyset:
+            self._sig_keyset = frozenset(params)
+            self._sig_keys = tuple(sorted(params))
+
+        # key on the signed strings: equal values with different str()
+        # (1 vs True vs 1.0) must not share a cache entry
+        pairs = []
+        for k in self._sig_keys:
+            v = params[k]
+            pairs.append((k, v if type(v) is str else str(v)))
+        key = tuple(pairs)
+
+        sig = self._sig_cache.get(key)
+        if sig is not None:
+            self._sig_cache.move_to_end(key)
+            return sig
+
+        buf = self._sig_buf  # safe: no awaits until the hash is taken
+        del buf[:]
+        for k, v in key:
+            buf += k.encode()
+            buf += b'='
+            buf += v.encode()
+        buf += self._secret_b
+        h = self._md5_prefix.copy()
+        h.update(buf)
+        sig = h.digest().hex()
+
+        self._sig_cache[key] = sig
+        if len(self._sig_cache) > _SIG_CACHE_SIZE:
+            self._sig_cache.popitem(last=False)
+
         return sig
 
-    async def request(self, params: Dict[str, Any]) -> Dict[str, Any]:  # noqa
+    async def request(self, params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """Request data.
 
         Args:
-            params (Dict[str, Any]): query parameters
+            params (Optional[Dict[str, Any]]): query parameters
 
         Returns:
             Dict[str, Any]
 
         """
-        params = {k: params[k] for k in params if params[k]}
-        params['session_key'] = self.session_key
-        params['app_id'] = self.app_id
-        params['secure'] = self.secure
-        params.update({'sig': self.sign_params(params)})
-        return await super().request(params)
+        params = {k: v for k, v in params.items() if v} if params else {}
+        params.update(self._required_params)
+        params['sig'] = self.sign_params(params)
+        query = '&'.join(
+            f'{k}={quote(str(v), safe="")}' for k, v in params.items()
+        )
+        return await self._fetch(f'{API_PATH}?{query}')
+
+    async def request_many(
+        self,
+        params_list: List[Dict[str, Any]],
+    ) -> List[Any]:
+        """Execute several requests concurrently.
+
+        Args:
+            params_list (List[Dict[str, Any]]): query parameters per request
+
+        Returns:
+            List[Any]: responses, exceptions in place of failures
+
+        """
+        return await asyncio.gather(
+            *(self.request(params) for params in params_list),
+            return_exceptions=True,
+        )
@@ -1,5 +1,5 @@
 """aiomailru setup."""
-from setuptools import find_packages, setup
+from setuptools import setup
 
 setup(
     name='aiomailru',
@@ -12,12 +12,17 @@ setup(
     description='Python Mail.Ru API wrapper',
     long_description=open('README.rst').read(),
     license='BSD',
-    packages=find_packages(),
+    packages=['aiomailru'],
     platforms=['Any'],
-    python_requires='>=3.7',
+    python_requires='>=3.9',
     install_requires=['httpx<=1.0.0'],
+    extras_require={'http2': ['h2'], 'orjson': ['orjson']},
     setup_requires=['pytest-runner'],
-    tests_require=['pytest-asyncio', 'pytest-localserver'],
+    tests_require=[
+        'pytest-asyncio>=0.24',
+        'pytest-localserver',
+        'uvloop; sys_platform != "win32"',
+    ],
     keywords=['mail.ru api'],
     classifiers=[
         'Development Status :: 5 - Production/Stable',
@@ -27,9 +32,10 @@ setup(
         'License :: OSI Approved :: BSD License',
         'Operating System :: OS Independent',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Programming Language :: Python :: 3 :: Only',
         'Topic :: Internet',
         'Topic :: Internet :: WWW/HTTP',
@@ -1,17 +1,30 @@
 """Conftest."""
+import asyncio
 import json
-from asyncio import AbstractEventLoop, get_event_loop_policy
-from typing import Generator
 
 import pytest
+from pytest_localserver.http import ContentServer
+
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+_ERROR_BODY = json.dumps({'error': {
+    'error_code': -1,
+    'error_msg': 'test error msg',
+}}).encode()
+_DATA_BODY = json.dumps({'key': 'value'}).encode()
 
 
 @pytest.fixture(scope='session')
-def event_loop() -> Generator[AbstractEventLoop, None, None]:
-    """Event loop."""
-    loop = get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def httpserver():
+    """Return an HTTP server shared by the whole test session."""
+    server = ContentServer()
+    server.start()
+    yield server
+    server.stop()
 
 
 @pytest.fixture
@@ -19,11 +32,11 @@ async def error_server(httpserver):
     """Return error server."""
     httpserver.serve_content(**{
         'code': 401,
-        'headers': {'Content-Type': 'text/javascript; charset=utf-8'},
-        'content': json.dumps({'error': {
-            'error_code': -1,
-            'error_msg': 'test error msg',
-        }}),
+        'headers': {
+            'Content-Type': 'text/javascript; charset=utf-8',
+            'Content-Length': str(len(_ERROR_BODY)),
+        },
+        'content': _ERROR_BODY,
     })
     return httpserver
 
@@ -33,7 +46,10 @@ async def data_server(httpserver):
     """Return data server."""
     httpserver.serve_content(**{
         'code': 200,
-        'headers': {'Content-Type': 'text/javascript; charset=utf-8'},
-        'content': json.dumps({'key': 'value'}),
+        'headers': {
+            'Content-Type': 'text/javascript; charset=utf-8',
+            'Content-Length': str(len(_DATA_BODY)),
+        },
+        'content': _DATA_BODY,
     })
     return httpserver
@@ -1,65 +1,82 @@
 """Sessions tests."""
+import asyncio
+import hashlib
+
 import pytest
 from httpx import HTTPStatusError
 
 from aiomailru.session import PublicSession, TokenSession
 
+_TOKEN_DEFAULTS = {
+    'app_id': '123',
+    'session_key': 'session key',
+    'secret': 'secret key',
+    'secure': '1',
+    'uid': '',
+}
+
+
+@pytest.fixture
+def session_factory():
+    """Return a factory of sessions bound to a test server."""
+    def _make(kind, server, **overrides):
+        if kind == 'token':
+            session = TokenSession(**{**_TOKEN_DEFAULTS, **overrides})
+        else:
+            session = PublicSession()
+        session.client.base_url = server.url
+        return session
+    return _make
+
 
 class TestPublicSession:
     """Tests for PublicSession class."""
 
-    async def test_failed_request(self, error_server):
+    async def test_failed_request(self, session_factory, error_server):
         """Test failed request."""
-        session = PublicSession()
-        session.client.base_url = error_server.url
+        session = session_factory('public', error_server)
 
         with pytest.raises(HTTPStatusError):
             await session.request({})
 
-    async def test_regulat_request(self, data_server):
-        """Test regular request."""
-        session = PublicSession()
-        session.client.base_url = data_server.url
+    async def test_regulat_request(self, session_factory, data_server):
+        """Test regular requests, issued concurrently."""
+        session = session_factory('public', data_server)
 
-        assert await session.request({}) == {'key': 'value'}
+        responses = await asyncio.gather(
+            session.request({}),
+            session.request({}),
+        )
+        assert responses == [{'key': 'value'}, {'key': 'value'}]
 
 
 class TestTokenSession:
     """Tests of TokenSession class."""
 
-    @pytest.fixture
-    def app(self):
-        """Return app info."""
-        return {'app_id': 123, 'private_key': '', 'secret_key': ''}
+    def test_sign_params(self):
+        """Test signing synchronously, without an event loop."""
+        session = TokenSession(**{**_TOKEN_DEFAULTS, 'uid': 'uid'})
 
-    @pytest.fixture
-    def token(self):
-        """Return token info."""
-        return {'access_token': '', 'uid': 0}
+        expected = hashlib.md5(b'uidk=vsecret key').hexdigest()
+        assert session.sign_params({'k': 'v'}) == expected
+        # a repeated call is served from the signature cache
+        assert session.sign_params({'k': 'v'}) == expected
 
-    async def test_error_request_with_raising(self, error_server):
+    async def test_error_request_with_raising(
+        self, session_factory, error_server,
+    ):
         """Test error request that raises an error."""
-        session = TokenSession(
-            app_id='123',
-            session_key='session key',
-            secret='secret key',
-            secure='1',
-            uid='',
-        )
-        session.client.base_url = error_server.url
+        session = session_factory('token', error_server)
 
         with pytest.raises(HTTPStatusError):
             await session.request(params={'key': 'value'})
 
-    async def test_data_request(self, data_server):
-        """Test regular request."""
-        session = TokenSession(
-            app_id='123',
-            session_key='session key',
-            secret='secret key',
-            secure='1',
-            uid='',
-        )
-        session.client.base_url = data_server.url
+    async def test_data_request(self, session_factory, data_server):
+        """Test regular requests, issued concurrently."""
+        session = session_factory('token', data_server)
 
-        assert await session.request(params={'k': 'v'}) == {'key': 'value'}
+        responses = await asyncio.gather(
+            session.request(params={'k': 'v'}),
+            session.request(params={'k': 'v'}),
+        )
+        assert responses == [{'key': 'value'}, {'key': 'value'}]